@@ -15,60 +15,153 @@ Features:
     - Flexible tag format parsing
     - Automatic role assumption (AWS)
     - Operation waiting and validation
+
+API clients (boto3, GKE and Compute Engine) are created once per manager and
+shared by the worker threads; they are safe to use concurrently.
 """
 
 import argparse
 import logging
+import signal
 import sys
 import time
 import os
+import re
 import tempfile
-from typing import Dict, List, Tuple, Any
+import threading
+from collections import defaultdict
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Any
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from enum import Enum
 from logging.handlers import RotatingFileHandler
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import boto3
+import google.auth
+import google.auth.exceptions
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from google.cloud import container_v1
 from google.cloud import compute_v1
 from google.api_core import exceptions as google_exceptions
+from google.api_core import retry as google_retry
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Create log directory if it doesn't exist (cross-platform)
+# Default log file location used by --log-file (cross-platform); handlers are
+# attached by _configure_logging()
 log_dir = os.path.join(tempfile.gettempdir(), "node_group_manager")
-os.makedirs(log_dir, exist_ok=True)
-
-# Set up file handler with rotation
 log_file = os.path.join(log_dir, "node_group_manager.log")
-file_handler = RotatingFileHandler(
-    log_file,
-    maxBytes=10*1024*1024,  # 10MB
-    backupCount=5
+
+# Default upper bounds for concurrent workers. GKE serializes most operations
+# on a cluster, so node pools get a lower bound than ASGs.
+DEFAULT_AWS_MAX_WORKERS = 32
+DEFAULT_GCP_MAX_WORKERS = 5
+
+# Upper bound for concurrent instance group resizes, shared by all node pools
+IGM_RESIZE_MAX_WORKERS = 16
+
+# AWS client settings: let botocore back off adaptively when the API throttles,
+# and fail fast on unresponsive endpoints (the connection pool is sized from
+# the worker count in _get_aws_client)
+AWS_CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=5,
+    read_timeout=30
 )
-file_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(levelname)s - %(message)s'
-))
-
-# Set up console handler
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter(
-    '%(asctime)s - %(levelname)s - %(message)s'
-))
-
-# Add handlers to logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
-
-# Log startup information (detailed info goes to file, minimal to console)
-logger.debug("Starting Node Group Manager")
-logger.debug("Log file: %s", log_file)
-logger.debug("Python version: %s", sys.version)
-logger.debug("Working directory: %s", os.getcwd())
+
+# Maximum number of tags sent per CreateOrUpdateTags/DeleteTags request
+AWS_TAG_BATCH_SIZE = 25
+
+# Tag value parsers, e.g. "MaxSize=10;DesiredCapacity=5;MinSize=2" (AWS)
+# and "maxsize10-desiredcapacity5-minsize2" (GCP)
+# The AWS pattern captures every key=value pair; keys are then classified by
+# _aws_tag_key, so spellings such as "Max_Size" or "MinNodeSize" still parse
+_AWS_TAG_RE = re.compile(r'([^;=]+?)\s*=\s*(\d+)\s*(?=;|$)')
+_GCP_TAG_RE = re.compile(r'(max|min|desired)[^\d-]*?(\d+)', re.IGNORECASE)
+
+# Node pool instance group URL, e.g.
+# https://www.googleapis.com/compute/v1/projects/PROJECT/zones/ZONE/instanceGroupManagers/NAME
+_IGM_URL_RE = re.compile(r'/zones/(?P<zone>[^/]+)/instanceGroupManagers/(?P<name>[^/]+)/?$')
+
+# Polling settings for GKE operations (seconds). Start short so quick
+# operations (e.g. label updates) return within a second, then back off
+# for long-running resizes.
+DEFAULT_POLL_INTERVAL = 1
+MAX_POLL_INTERVAL = 10
+
+# Retry for GKE mutations: GKE rejects a new operation on a cluster while
+# another one is running (FailedPrecondition) and may briefly be unavailable.
+# Backs off exponentially with jitter instead of failing the node pool.
+_GKE_MUTATION_RETRY = google_retry.Retry(
+    predicate=google_retry.if_exception_type(
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.FailedPrecondition,
+    ),
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+# GKE operation statuses with the log level and message used when seen.
+# Terminal statuses end the wait, waiting statuses keep polling.
+_GKE_TERMINAL_STATUSES = {
+    container_v1.Operation.Status.DONE: (logging.INFO, "Operation completed successfully."),
+    container_v1.Operation.Status.ABORTING: (logging.WARNING, "Operation is aborting."),
+}
+_GKE_WAITING_STATUSES = {
+    container_v1.Operation.Status.PENDING: (logging.INFO, "Operation is pending..."),
+    container_v1.Operation.Status.RUNNING: (logging.INFO, "Operation is still running..."),
+    container_v1.Operation.Status.STATUS_UNSPECIFIED: (logging.DEBUG, "Operation status unspecified, continuing to wait..."),
+}
+
+def _aws_tag_key(key: str) -> str:
+    """Classify a key of an AWS format tag value.
+    
+    Args:
+        key: Key of a key=value pair, e.g. "MaxSize" or "Min_Size"
+        
+    Returns:
+        str: 'max', 'min' or 'desired', or None if the key is not recognized
+    """
+    key = key.strip().lower()
+    if 'maxsize' in key or (key.startswith('max') and 'size' in key):
+        return 'max'
+    if 'minsize' in key or (key.startswith('min') and 'size' in key):
+        return 'min'
+    if 'desiredcapacity' in key or ('desired' in key and 'capacity' in key):
+        return 'desired'
+    return None
+
+@lru_cache(maxsize=1)
+def _resolve_project_id(explicit: str = None) -> str:
+    """Resolve the GCP project ID once per process.
+    
+    The explicit value wins, then the GOOGLE_CLOUD_PROJECT / PROJECT_ID
+    environment variables; only if neither is set are the application
+    default credentials (and possibly the metadata server) queried.
+    
+    Args:
+        explicit: Project ID given on the command line, if any
+        
+    Returns:
+        str: The project ID, or None if it cannot be determined
+    """
+    if explicit:
+        return explicit
+    project_id = os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("PROJECT_ID")
+    if project_id:
+        return project_id
+    try:
+        _, project_id = google.auth.default()
+    except google.auth.exceptions.DefaultCredentialsError:
+        return None
+    return project_id
 
 class CloudProvider(Enum):
     """Supported cloud providers."""
@@ -87,6 +180,7 @@ class ScalingOperation:
         max_size: Maximum number of nodes
         provider: Cloud provider (AWS or GCP)
     """
+    __slots__ = ('resource_name', 'current_size', 'target_size', 'min_size', 'max_size', 'provider')
     resource_name: str
     current_size: int
     target_size: int
@@ -94,6 +188,22 @@ class ScalingOperation:
     max_size: int
     provider: CloudProvider
 
+@dataclass(frozen=True)
+class _PoolCtx:
+    """Identifies a GKE node pool for the requests issued while processing it.
+    
+    Attributes:
+        name: Full resource name of the node pool
+        project_id: The GCP project ID
+        location: The cluster location (region or zone)
+        pool: The node pool object from the cluster listing
+    """
+    __slots__ = ('name', 'project_id', 'location', 'pool')
+    name: str
+    project_id: str
+    location: str
+    pool: Any
+
 class ValidationError(Exception):
     """Custom exception for input validation errors."""
     pass
@@ -101,16 +211,24 @@ class ValidationError(Exception):
 class NodeGroupManager:
     """Main class for managing node groups across cloud providers."""
     
-    def __init__(self, cluster_name: str, cloud_provider: str, account: str = None, region: str = None, dry_run: bool = False, scale_down: bool = False):
+    def __init__(self, cluster_name: str, cloud_provider: str, account: str = None, region: str = None, dry_run: bool = False, scale_down: bool = False, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 max_concurrency: int = None, legacy_scan: bool = False, location: str = None):
         """Initialize the node group manager.
         
         Args:
             cluster_name: Name of the Kubernetes cluster
             cloud_provider: Cloud provider ('aws' or 'gcp')
-            account: AWS account ID or GCP project ID (required for GCP)
+            account: AWS account ID or GCP project ID (for GCP, defaults to the
+                GOOGLE_CLOUD_PROJECT/PROJECT_ID environment or the default credentials)
             region: AWS region (required for AWS)
             dry_run: If True, only show what would be changed
             scale_down: If True, scale down to 0 and save current state
+            poll_interval: Initial interval in seconds between GKE operation status checks
+            max_concurrency: Maximum number of node groups processed concurrently
+                (default: automatic, based on the provider and the number of node groups)
+            legacy_scan: If True, scan every ASG in scale-up mode instead of filtering on the tag
+            location: GKE cluster location (region or zone); if set, the cluster is
+                fetched directly instead of listing every cluster in the project
         """
         self.cluster_name = cluster_name
         self.cloud_provider = CloudProvider(cloud_provider.lower())
@@ -118,7 +236,20 @@ class NodeGroupManager:
         self.region = region
         self.dry_run = dry_run
         self.scale_down = scale_down
-        self.operations: List[ScalingOperation] = []
+        self.poll_interval = poll_interval
+        self.max_concurrency = max_concurrency
+        self.legacy_scan = legacy_scan
+        self.location = location
+        self._ops_by_provider: Dict[CloudProvider, List[ScalingOperation]] = defaultdict(list)
+        self._operations_lock = threading.Lock()
+        self._aws_session = None
+        self._aws_clients: Dict[str, Any] = {}
+        self._aws_clients_lock = threading.Lock()
+        self._gke_client = None
+        self._igm_client = None
+        self._igm_client_lock = threading.Lock()
+        self._igm_executor = None
+        self._stop_event = threading.Event()
         
         # Log configuration (detailed to file, summary to console)
         logger.debug("Initializing NodeGroupManager")
@@ -128,10 +259,14 @@ class NodeGroupManager:
         logger.debug("Region: %s", region)
         logger.debug("Dry run mode: %s", dry_run)
         logger.debug("Scale down mode: %s", scale_down)
+        logger.debug("Poll interval: %s", poll_interval)
+        logger.debug("Max concurrency: %s", max_concurrency or "auto")
+        logger.debug("Legacy scan: %s", legacy_scan)
+        logger.debug("Location: %s", location)
         
-        logger.info(f"Managing node groups for cluster: {cluster_name} ({cloud_provider.upper()})")
+        logger.info("Managing node groups for cluster: %s (%s)", cluster_name, cloud_provider.upper())
         if self.region:
-            logger.info(f"Region: {region}")
+            logger.info("Region: %s", region)
         if self.dry_run:
             logger.info("DRY RUN MODE - No changes will be made")
         if self.scale_down:
@@ -140,6 +275,88 @@ class NodeGroupManager:
         logger.debug("Validating inputs...")
         self.validate_inputs()
         logger.debug("Input validation completed successfully")
+        
+        if self.cloud_provider == CloudProvider.AWS:
+            # One session for every AWS client; its credentials are resolved
+            # here once and reused by each client created from it
+            self._aws_session = boto3.Session()
+            self._log_aws_credentials(self._aws_session.get_credentials())
+        
+        if self.cloud_provider == CloudProvider.GCP:
+            # One client (and gRPC channel) for every GKE call of this run
+            self._gke_client = container_v1.ClusterManagerClient()
+            # One bounded pool for instance group resizes of every node pool
+            self._igm_executor = ThreadPoolExecutor(
+                max_workers=IGM_RESIZE_MAX_WORKERS, thread_name_prefix="igm-resize"
+            )
+
+    def __enter__(self) -> 'NodeGroupManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the shared API clients, their connections and the resize pool.
+        
+        The clients are created once per manager and reused for every call,
+        so their channels are released here rather than after each request.
+        """
+        if self._igm_executor is not None:
+            self._igm_executor.shutdown(wait=True)
+            self._igm_executor = None
+        with self._aws_clients_lock:
+            for client in self._aws_clients.values():
+                client.close()
+            self._aws_clients.clear()
+        with self._igm_client_lock:
+            if self._igm_client is not None:
+                self._igm_client.transport.close()
+                self._igm_client = None
+        if self._gke_client is not None:
+            self._gke_client.transport.close()
+            self._gke_client = None
+
+    def stop(self) -> None:
+        """Request the manager to stop.
+        
+        Pending waits on GKE operations are interrupted instead of sleeping
+        out their polling interval. Safe to call from a signal handler.
+        """
+        self._stop_event.set()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether stop() was called.
+        
+        Returns:
+            bool: True if the manager was asked to stop
+        """
+        return self._stop_event.is_set()
+
+    def _raise_if_stopped(self, resource_name: str) -> None:
+        """Refuse to start another change once stop() was called.
+        
+        Checked before each mutation, so node groups still queued in the
+        thread pool are skipped instead of being half updated.
+        
+        Args:
+            resource_name: Name of the node group about to be changed
+            
+        Raises:
+            InterruptedError: If stop() was called
+        """
+        if self.stopped:
+            raise InterruptedError(f"Stopped before updating {resource_name}")
+
+    @property
+    def operations(self) -> List[ScalingOperation]:
+        """All planned scaling operations, across providers.
+        
+        Returns:
+            List[ScalingOperation]: The planned operations
+        """
+        return list(chain.from_iterable(self._ops_by_provider.values()))
 
     @property
     def tag_name(self) -> str:
@@ -159,11 +376,37 @@ class NodeGroupManager:
         if not self.cluster_name:
             raise ValidationError("Cluster name cannot be empty")
         
-        if self.cloud_provider == CloudProvider.GCP and not self.account:
-            raise ValidationError("GCP project ID is required")
+        if self.cloud_provider == CloudProvider.GCP and not _resolve_project_id(self.account):
+            raise ValidationError("GCP project ID is required (use --account or set GOOGLE_CLOUD_PROJECT)")
         
         if self.cloud_provider == CloudProvider.AWS and not self.region:
             raise ValidationError("AWS region is required")
+        
+        if self.poll_interval <= 0:
+            raise ValidationError("Poll interval must be greater than 0")
+        
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValidationError("Max concurrency must be at least 1")
+
+    def _max_workers(self, item_count: int = None) -> int:
+        """Get the number of worker threads to use for the current provider.
+        
+        Args:
+            item_count: Number of items to process, if known up front
+            
+        Returns:
+            int: The --max-concurrency value if set, otherwise the provider
+            default bounded by item_count
+        """
+        if self.max_concurrency:
+            workers = self.max_concurrency
+        elif self.cloud_provider == CloudProvider.AWS:
+            workers = DEFAULT_AWS_MAX_WORKERS
+        else:
+            workers = DEFAULT_GCP_MAX_WORKERS
+        if item_count is not None:
+            workers = min(workers, item_count)
+        return max(workers, 1)
 
     def manage_node_groups(self) -> None:
         """Main method to manage node groups.
@@ -179,7 +422,7 @@ class NodeGroupManager:
             else:
                 self._manage_gcp_node_groups()
         except Exception as e:
-            logger.error(f"Error managing node groups: {str(e)}")
+            logger.error("Error managing node groups: %s", e)
             raise
 
     def _parse_scaling_values(self, tag_value: str) -> Tuple[int, int, int]:
@@ -200,26 +443,10 @@ class NodeGroupManager:
             ValueError: If parsing fails or values are invalid
         """
         try:
-            normalized_value = tag_value.lower()
-            logger.debug(f"Parsing tag: {tag_value}")
-            
-            # Parse AWS format (semicolon-separated)
-            if ';' in normalized_value:
-                values = self._parse_aws_format(normalized_value)
-            
-            # Parse GCP format (dash-separated)
-            elif '-' in normalized_value:
-                values = self._parse_gcp_format(normalized_value)
-            
-            else:
-                raise ValueError("Unsupported tag format")
-            
-            # Validate parsed values
-            self._validate_scaling_values(values)
-            return values['max'], values['desired'], values['min']
-                
+            logger.debug("Parsing tag: %s", tag_value)
+            return self._parse_tag_value(tag_value)
         except Exception as e:
-            logger.error(f"Error parsing tag: {tag_value}")
+            logger.error("Error parsing tag: %s", tag_value)
             raise ValueError(
                 "Invalid tag format. Expected:\n"
                 "AWS: MaxSize=X;DesiredCapacity=Y;MinSize=Z\n"
@@ -227,35 +454,55 @@ class NodeGroupManager:
                 f"Got: {tag_value}"
             )
 
-    def _parse_aws_format(self, value: str) -> Dict[str, int]:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _parse_tag_value(value: str) -> Tuple[int, int, int]:
+        """Parse and validate a tag value.
+        
+        Results are cached per tag value: node groups of a cluster often
+        share the same saved state, and the cache outlives a single manager
+        when the module is imported by a long-running scheduler.
+        
+        Args:
+            value: The tag value (keys are matched case-insensitively)
+            
+        Returns:
+            Tuple of (max_size, desired_capacity, min_size)
+            
+        Raises:
+            ValueError: If parsing fails or values are invalid
+        """
+        # Parse AWS format (semicolon-separated)
+        if ';' in value:
+            values = NodeGroupManager._parse_aws_format(value)
+        
+        # Parse GCP format (dash-separated)
+        elif '-' in value:
+            values = NodeGroupManager._parse_gcp_format(value)
+        
+        else:
+            raise ValueError("Unsupported tag format")
+        
+        # Validate parsed values
+        NodeGroupManager._validate_scaling_values(values)
+        return values['max'], values['desired'], values['min']
+
+    @staticmethod
+    def _parse_aws_format(value: str) -> Dict[str, int]:
         """Parse AWS format tag value.
         
-        Handles random order of parameters in the tag value.
-        Looks for keys containing 'maxsize', 'minsize', or 'desiredcapacity'
-        regardless of their position in the string.
+        Handles random order of parameters in the tag value: the key=value
+        pairs are extracted in a single pass and keys containing 'maxsize',
+        'minsize' or 'desiredcapacity' (or variants, see _aws_tag_key) are
+        recognized regardless of their position in the string.
         """
         values = {}
-        for param in value.split(';'):
-            param = param.strip()
-            if not param:
-                continue
-            try:
-                key, val = param.split('=', 1)
-                key = key.strip().lower()
-                val = val.strip()
-                
-                # Match keys regardless of order - look for specific patterns
-                if 'maxsize' in key or (key.startswith('max') and 'size' in key):
-                    values['max'] = int(val)
-                elif 'minsize' in key or (key.startswith('min') and 'size' in key):
-                    values['min'] = int(val)
-                elif 'desiredcapacity' in key or ('desired' in key and 'capacity' in key):
-                    values['desired'] = int(val)
-                else:
-                    logger.warning(f"Unrecognized key in AWS tag format: {key}")
-            except ValueError as e:
-                logger.warning(f"Error parsing parameter '{param}': {str(e)}")
-                continue
+        for key, val in _AWS_TAG_RE.findall(value):
+            name = _aws_tag_key(key)
+            if name:
+                values[name] = int(val)
+            else:
+                logger.warning("Unrecognized key in AWS tag format: %s", key.strip())
         
         if len(values) != 3:
             missing = []
@@ -268,23 +515,17 @@ class NodeGroupManager:
             raise ValueError(f"Missing required values in AWS format: {', '.join(missing)}")
         return values
 
-    def _parse_gcp_format(self, value: str) -> Dict[str, int]:
+    @staticmethod
+    def _parse_gcp_format(value: str) -> Dict[str, int]:
         """Parse GCP format tag value."""
-        values = {}
-        for part in value.split('-'):
-            part = part.strip()
-            if 'max' in part:
-                values['max'] = int(''.join(filter(str.isdigit, part)))
-            elif 'min' in part:
-                values['min'] = int(''.join(filter(str.isdigit, part)))
-            elif 'desired' in part:
-                values['desired'] = int(''.join(filter(str.isdigit, part)))
+        values = {key.lower(): int(val) for key, val in _GCP_TAG_RE.findall(value)}
         
         if len(values) != 3:
             raise ValueError("Missing required values in GCP format")
         return values
 
-    def _validate_scaling_values(self, values: Dict[str, int]) -> None:
+    @staticmethod
+    def _validate_scaling_values(values: Dict[str, int]) -> None:
         """Validate scaling values.
         
         Args:
@@ -309,9 +550,29 @@ class NodeGroupManager:
         if not min_size <= desired <= max_size:
             raise ValueError(f"Desired {desired} not between min {min_size} and max {max_size}")
 
+    @staticmethod
+    def _log_aws_credentials(credentials: Any) -> None:
+        """Log which kind of AWS credentials the session resolved.
+        
+        Args:
+            credentials: Credentials from the default provider chain, or None
+        """
+        if credentials is None:
+            logger.debug("No AWS credentials found by the default provider chain")
+        elif credentials.token:
+            logger.debug("Using AWS session credentials (likely from CloudShell)")
+        elif credentials.access_key:
+            logger.debug("Using AWS access key credentials")
+        else:
+            logger.debug("Using default AWS credential provider chain")
+
     def _get_aws_client(self, service_name: str):
         """Get an AWS client for the specified service.
         
+        Clients are created once per service from the session built in
+        __init__ and cached. boto3 clients are thread-safe, so the cached
+        client is shared by all worker threads.
+        
         Args:
             service_name: Name of the AWS service
             
@@ -321,60 +582,175 @@ class NodeGroupManager:
         Raises:
             Exception: If client creation fails
         """
-        logger.debug("Creating AWS client for service: %s", service_name)
-        try:
-            # Create a session to use the default credential provider chain
-            session = boto3.Session()
-            
-            # Log which credential source is being used (only once, on first client creation)
-            if not hasattr(self, '_aws_credentials_logged'):
-                credentials = session.get_credentials()
-                if credentials.token:
-                    logger.debug("Using AWS session credentials (likely from CloudShell)")
-                elif credentials.access_key:
-                    logger.debug("Using AWS access key credentials")
-                else:
-                    logger.debug("Using default AWS credential provider chain")
-                self._aws_credentials_logged = True
+        with self._aws_clients_lock:
+            if service_name in self._aws_clients:
+                return self._aws_clients[service_name]
             
-            # Create client with the session
-            return session.client(service_name, region_name=self.region)
-        except Exception as e:
-            logger.error(f"Failed to create AWS {service_name} client: {str(e)}")
-            raise
+            logger.debug("Creating AWS client for service: %s", service_name)
+            try:
+                # Create client with the shared session
+                # Keep the connection pool larger than the worker count so urllib3
+                # does not serialize requests from concurrent threads
+                config = AWS_CLIENT_CONFIG.merge(Config(max_pool_connections=self._max_workers() * 2))
+                client = self._aws_session.client(service_name, region_name=self.region, config=config)
+                self._aws_clients[service_name] = client
+                return client
+            except Exception as e:
+                logger.error("Failed to create AWS %s client: %s", service_name, e)
+                raise
 
     def _add_operation(self, operation: ScalingOperation) -> None:
         """Add a scaling operation to the planned operations list.
         
         This method adds a scaling operation to the list of operations to be performed.
         In dry run mode, it only logs the operation without executing it.
+        It is called from the worker threads, so the list is updated under a lock.
+        Operations are grouped by provider so the summaries need not filter them.
         
         Args:
             operation: The scaling operation to add
         """
-        self.operations.append(operation)
+        with self._operations_lock:
+            self._ops_by_provider[operation.provider].append(operation)
         if self.dry_run:
             if self.scale_down and operation.target_size == 0:
                 logger.info(
-                    f"[DRY RUN] Would scale down {operation.resource_name} "
-                    f"from {operation.current_size} to 0 nodes "
-                    f"and save state (min={operation.min_size}, max={operation.max_size}, desired={operation.current_size})"
+                    "[DRY RUN] Would scale down %s from %s to 0 nodes "
+                    "and save state (min=%s, max=%s, desired=%s)",
+                    operation.resource_name, operation.current_size,
+                    operation.min_size, operation.max_size, operation.current_size
                 )
             else:
                 logger.info(
-                    f"[DRY RUN] Would scale {operation.resource_name} "
-                    f"from {operation.current_size} to {operation.target_size} nodes "
-                    f"(min={operation.min_size}, max={operation.max_size})"
+                    "[DRY RUN] Would scale %s from %s to %s nodes (min=%s, max=%s)",
+                    operation.resource_name, operation.current_size, operation.target_size,
+                    operation.min_size, operation.max_size
                 )
         else:
             logger.debug(
-                f"Planning to scale {operation.resource_name} "
-                f"from {operation.current_size} to {operation.target_size} nodes "
-                f"(min={operation.min_size}, max={operation.max_size})"
+                "Planning to scale %s from %s to %s nodes (min=%s, max=%s)",
+                operation.resource_name, operation.current_size, operation.target_size,
+                operation.min_size, operation.max_size
             )
 
-    def _process_aws_asg(self, asg: Dict) -> bool:
-        """Process a single AWS ASG (scale down or scale up).
+    def _run_parallel(self, func: Callable[[Any], Tuple[str, bool]], items: Iterable[Any], max_workers: int,
+                      on_processed: Callable[[str], None] = None) -> List[str]:
+        """Run a processing function over items in a thread pool.
+        
+        All cloud API calls are blocking I/O, so processing resources
+        concurrently overlaps their network round-trips. Items are submitted
+        as they are produced, so a lazy iterable (e.g. a paginated listing)
+        overlaps fetching the next page with processing the previous ones.
+        
+        Args:
+            func: Function applied to each item, returning (name, processed). It
+                must handle and log its own errors
+            items: Items to process
+            max_workers: Maximum number of worker threads
+            on_processed: Optional function called in the calling thread with the
+                name of each processed item as soon as it completes, also when
+                iterating items raises
+            
+        Returns:
+            List[str]: Names of the items for which func reported processed
+        """
+        processed = []
+        futures = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for item in items:
+                    futures.append(executor.submit(func, item))
+            finally:
+                # If producing the items fails part way (e.g. a later page of a
+                # listing), the items already submitted still run: wait for them
+                # and report them before the error propagates
+                for future in as_completed(futures):
+                    name, was_processed = future.result()
+                    if was_processed:
+                        processed.append(name)
+                        if on_processed:
+                            on_processed(name)
+        return processed
+
+    def _aws_tag(self, asg_name: str, value: str = None) -> Dict[str, Any]:
+        """Build an OffHoursPrevious tag entry for the autoscaling tag APIs.
+        
+        Args:
+            asg_name: Name of the ASG
+            value: Tag value, omitted for delete_tags
+            
+        Returns:
+            Dict: Tag entry
+        """
+        tag = {
+            'ResourceId': asg_name,
+            'ResourceType': 'auto-scaling-group',
+            'Key': self.tag_name
+        }
+        if value is not None:
+            tag['Value'] = value
+            tag['PropagateAtLaunch'] = False
+        return tag
+
+    def _batch_aws_tags(self, tag_call: Callable[..., Any], tags: List[Dict[str, Any]]) -> List[str]:
+        """Send tag entries to an autoscaling tag API in batches.
+        
+        CreateOrUpdateTags and DeleteTags accept tags for several ASGs in one
+        request, so tags are sent in chunks of AWS_TAG_BATCH_SIZE instead of
+        one call per ASG. If a chunk is rejected, its entries are retried one
+        at a time so a single failing ASG does not hold back the others.
+        
+        Args:
+            tag_call: autoscaling.create_or_update_tags or autoscaling.delete_tags
+            tags: Tag entries to send
+            
+        Returns:
+            List[str]: Names of the ASGs whose tags were applied
+        """
+        applied = []
+        for i in range(0, len(tags), AWS_TAG_BATCH_SIZE):
+            batch = tags[i:i + AWS_TAG_BATCH_SIZE]
+            asg_names = [tag['ResourceId'] for tag in batch]
+            try:
+                tag_call(Tags=batch)
+                applied.extend(asg_names)
+            except ClientError as e:
+                if len(batch) == 1:
+                    logger.error("Error updating %s tag for ASG %s: %s", self.tag_name, asg_names[0], e)
+                    continue
+                # One bad entry (e.g. an ASG deleted in the meantime) fails the
+                # whole request: retry the entries one by one so only it is skipped
+                logger.warning("Error updating %s tags for ASGs %s, retrying one by one: %s",
+                               self.tag_name, ", ".join(asg_names), e)
+                for tag in batch:
+                    try:
+                        tag_call(Tags=[tag])
+                        applied.append(tag['ResourceId'])
+                    except ClientError as e:
+                        logger.error("Error updating %s tag for ASG %s: %s", self.tag_name, tag['ResourceId'], e)
+        return applied
+
+    def _process_aws_asg(self, asg: Dict) -> Tuple[str, bool]:
+        """Process a single AWS ASG, logging any error with the ASG name.
+        
+        Args:
+            asg: ASG dictionary from describe_auto_scaling_groups
+            
+        Returns:
+            Tuple of (ASG name, True if the ASG was processed)
+        """
+        asg_name = asg['AutoScalingGroupName']
+        try:
+            return asg_name, self._apply_aws_asg(asg)
+        except InterruptedError as e:
+            logger.warning("ASG %s not processed: %s", asg_name, e)
+            return asg_name, False
+        except Exception as e:
+            logger.error("Unexpected error processing ASG %s: %s", asg_name, e)
+            return asg_name, False
+
+    def _apply_aws_asg(self, asg: Dict) -> bool:
+        """Apply scaling to a single AWS ASG (scale down or scale up).
         
         Args:
             asg: ASG dictionary from describe_auto_scaling_groups
@@ -383,6 +759,7 @@ class NodeGroupManager:
             bool: True if the ASG was processed, False otherwise
         """
         asg_name = asg['AutoScalingGroupName']
+        self._raise_if_stopped(asg_name)
         autoscaling = self._get_aws_client('autoscaling')
         
         try:
@@ -391,16 +768,11 @@ class NodeGroupManager:
                 return self._scale_down_aws_asg(autoscaling, asg, asg_name)
             else:
                 # Scale up mode: restore from OffHoursPrevious tag
-                off_hours_previous = None
-                
-                # Find OffHoursPrevious tag
-                for tag in asg['Tags']:
-                    if tag['Key'] == self.tag_name:
-                        off_hours_previous = tag['Value']
-                        logger.debug(f"Found {self.tag_name} tag with value: {off_hours_previous}")
-                        break
+                tags = {tag['Key']: tag['Value'] for tag in asg.get('Tags', ())}
+                off_hours_previous = tags.get(self.tag_name)
                 
                 if off_hours_previous:
+                    logger.debug("Found %s tag with value: %s", self.tag_name, off_hours_previous)
                     try:
                         max_size, desired_capacity, min_size = self._parse_scaling_values(off_hours_previous)
                         
@@ -416,40 +788,32 @@ class NodeGroupManager:
                         self._add_operation(operation)
                         
                         # Execute operation if not in dry run mode
+                        # (the OffHoursPrevious tag is removed afterwards in a batch)
                         if not self.dry_run:
-                            logger.info(f"  → Updating {asg_name}: scaling from {asg['DesiredCapacity']} to {desired_capacity} nodes (min={min_size}, max={max_size})")
+                            logger.info("  → Updating %s: scaling from %s to %s nodes (min=%s, max=%s)",
+                                        asg_name, asg['DesiredCapacity'], desired_capacity, min_size, max_size)
                             autoscaling.update_auto_scaling_group(
                                 AutoScalingGroupName=asg_name,
                                 MinSize=min_size,
                                 MaxSize=max_size,
                                 DesiredCapacity=desired_capacity
                             )
-                            logger.info(f"  ✓ Successfully updated {asg_name}")
-                            
-                            # Remove the OffHoursPrevious tag after successful update
-                            autoscaling.delete_tags(
-                                Tags=[
-                                    {
-                                        'ResourceId': asg_name,
-                                        'ResourceType': 'auto-scaling-group',
-                                        'Key': self.tag_name
-                                    }
-                                ]
-                            )
-                            logger.debug(f"Removed {self.tag_name} tag from {asg_name}")
-                            return True
-                        else:
-                            return True
+                            logger.info("  ✓ Successfully updated %s", asg_name)
+                        return True
                         
                     except ValueError as e:
-                        logger.error(f"Error parsing scaling values for ASG {asg_name}: {str(e)}")
+                        logger.error("Error parsing scaling values for ASG %s: %s", asg_name, e)
                         return False
                 else:
-                    logger.debug(f"No {self.tag_name} tag found for ASG: {asg_name}")
+                    logger.debug("No %s tag found for ASG: %s", self.tag_name, asg_name)
                     return False
                 
         except ClientError as e:
-            logger.error(f"Error processing ASG {asg_name}: {str(e)}")
+            if e.response.get('Error', {}).get('Code') == 'Throttling':
+                # botocore already retried with adaptive backoff, don't retry again
+                logger.error("ASG %s is still throttled after retries: %s", asg_name, e)
+            else:
+                logger.error("Error processing ASG %s: %s", asg_name, e)
             return False
 
     def _manage_aws_node_groups(self) -> None:
@@ -464,45 +828,65 @@ class NodeGroupManager:
             ValueError: If tag parsing fails
         """
         try:
-            logger.debug(f"Starting AWS node group management for cluster: {self.cluster_name}")
+            logger.debug("Starting AWS node group management for cluster: %s", self.cluster_name)
             
             # Get AWS clients
             autoscaling = self._get_aws_client('autoscaling')
             
-            # Get all ASGs
-            logger.info("Searching for Auto Scaling Groups...")
-            paginator = autoscaling.get_paginator('describe_auto_scaling_groups')
+            if self.scale_down or self.legacy_scan:
+                # Scale down needs every ASG of the cluster
+                logger.info("Searching for Auto Scaling Groups...")
+                asg_pages = self._scan_aws_asgs(autoscaling)
+            else:
+                # Scale up only needs the ASGs carrying a saved state: filter on the tag server-side
+                logger.info("Searching for Auto Scaling Groups with %s tag...", self.tag_name)
+                asg_pages = self._scan_aws_asgs(
+                    autoscaling, filters=[{'Name': 'tag-key', 'Values': [self.tag_name]}]
+                )
+            
             asg_count = 0
-            matching_asgs = []
+            matching_asg_count = 0
             
-            for page in paginator.paginate():
-                for asg in page['AutoScalingGroups']:
-                    asg_count += 1
-                    asg_name = asg['AutoScalingGroupName']
-                    logger.debug(f"Found ASG: {asg_name}")
-                    
-                    # Check if ASG name contains cluster name
-                    if self.cluster_name in asg_name:
-                        matching_asgs.append(asg)
-                        logger.debug(f"Found matching ASG: {asg_name}")
+            def asgs_to_process() -> Iterator[Dict]:
+                # Hand over matching ASGs page by page, so the thread pool starts
+                # processing while the next page is still being fetched
+                nonlocal asg_count, matching_asg_count
+                for scanned_count, matching_asgs in asg_pages:
+                    if self.stopped:
+                        # Don't fetch (or save the state of) further pages
+                        break
+                    asg_count += scanned_count
+                    if not matching_asgs:
+                        continue
+                    matching_asg_count += len(matching_asgs)
+                    if self.scale_down and not self.dry_run:
+                        # Save state first, only scale down the ASGs that were saved
+                        matching_asgs = self._save_aws_asg_states(autoscaling, matching_asgs)
+                    yield from matching_asgs
             
-            matching_asg_count = len(matching_asgs)
+            tags_to_remove = []
+            
+            def remove_state_tag(asg_name: str) -> None:
+                # Remove the OffHoursPrevious tags of restored ASGs in full batches
+                # while the remaining ASGs are still being updated
+                tags_to_remove.append(self._aws_tag(asg_name))
+                if len(tags_to_remove) == AWS_TAG_BATCH_SIZE:
+                    self._batch_aws_tags(autoscaling.delete_tags, tags_to_remove)
+                    tags_to_remove.clear()
             
             # Process ASGs in parallel
-            processed_count = 0
-            if matching_asgs:
-                logger.info(f"Processing {matching_asg_count} ASGs in parallel...")
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    futures = {executor.submit(self._process_aws_asg, asg): asg for asg in matching_asgs}
-                    
-                    for future in as_completed(futures):
-                        asg = futures[future]
-                        try:
-                            was_processed = future.result()
-                            if was_processed:
-                                processed_count += 1
-                        except Exception as e:
-                            logger.error(f"Error processing ASG {asg['AutoScalingGroupName']}: {str(e)}")
+            logger.info("Processing matching ASGs in parallel...")
+            try:
+                processed_asgs = self._run_parallel(
+                    self._process_aws_asg, asgs_to_process(), max_workers=self._max_workers(),
+                    on_processed=None if self.scale_down or self.dry_run else remove_state_tag
+                )
+            finally:
+                if tags_to_remove:
+                    # Remove the OffHoursPrevious tags of the last restored ASGs,
+                    # even if listing the remaining ASGs failed
+                    self._batch_aws_tags(autoscaling.delete_tags, tags_to_remove)
+            processed_count = len(processed_asgs)
             
             # Summary
             logger.info("")
@@ -512,46 +896,115 @@ class NodeGroupManager:
             else:
                 logger.info("SUMMARY")
             logger.info("=" * 60)
-            logger.info(f"Total ASGs scanned: {asg_count}")
-            logger.info(f"ASGs matching cluster '{self.cluster_name}': {matching_asg_count}")
+            if self.scale_down or self.legacy_scan:
+                logger.info("Total ASGs scanned: %s", asg_count)
+            else:
+                logger.info("Total ASGs with %s tag: %s", self.tag_name, asg_count)
+            logger.info("ASGs matching cluster '%s': %s", self.cluster_name, matching_asg_count)
             
             if self.dry_run:
-                # In dry run, count operations that would be performed (filter by AWS provider)
-                aws_operations = [op for op in self.operations if op.provider == CloudProvider.AWS]
+                # In dry run, count operations that would be performed
+                aws_operations = self._ops_by_provider[CloudProvider.AWS]
                 would_update_count = len(aws_operations)
                 if would_update_count > 0:
-                    logger.info(f"ASGs that would be updated: {would_update_count}")
+                    logger.info("ASGs that would be updated: %s", would_update_count)
                     for op in aws_operations:
                         if self.scale_down:
-                            logger.info(f"  - {op.resource_name}: {op.current_size} → 0 nodes (saving state: min={op.min_size}, max={op.max_size}, desired={op.current_size})")
+                            logger.info("  - %s: %s → 0 nodes (saving state: min=%s, max=%s, desired=%s)", op.resource_name, op.current_size, op.min_size, op.max_size, op.current_size)
                         else:
-                            logger.info(f"  - {op.resource_name}: {op.current_size} → {op.target_size} nodes (min={op.min_size}, max={op.max_size})")
+                            logger.info("  - %s: %s → %s nodes (min=%s, max=%s)", op.resource_name, op.current_size, op.target_size, op.min_size, op.max_size)
                 elif matching_asg_count > 0:
                     if self.scale_down:
                         logger.info("No ASGs would be updated (already at 0 or no matching ASGs)")
                     else:
                         logger.info("No ASGs would be updated (no OffHoursPrevious tags found)")
                 else:
-                    logger.warning(f"No ASGs found matching cluster name: {self.cluster_name}")
+                    logger.warning("No ASGs found matching cluster name: %s", self.cluster_name)
             else:
                 # Normal execution
                 if processed_count > 0:
-                    logger.info(f"ASGs successfully updated: {processed_count}")
+                    logger.info("ASGs successfully updated: %s", processed_count)
                 elif matching_asg_count > 0:
                     if self.scale_down:
                         logger.info("No ASGs required updates (already at 0 or no matching ASGs)")
                     else:
                         logger.info("No ASGs required updates (no OffHoursPrevious tags found)")
                 else:
-                    logger.warning(f"No ASGs found matching cluster name: {self.cluster_name}")
+                    logger.warning("No ASGs found matching cluster name: %s", self.cluster_name)
             logger.info("=" * 60)
                         
         except ClientError as e:
-            logger.error(f"AWS API error: {str(e)}")
+            logger.error("AWS API error: %s", e)
             raise
 
+    def _scan_aws_asgs(self, autoscaling, filters: List[Dict] = None) -> Iterator[Tuple[int, List[Dict]]]:
+        """Scan ASGs in the region for the ones matching the cluster name.
+        
+        Args:
+            autoscaling: AWS autoscaling client
+            filters: Optional server-side describe_auto_scaling_groups filters
+            
+        Yields:
+            Tuple of (number of ASGs scanned, matching ASG dictionaries) per page
+        """
+        paginator = autoscaling.get_paginator('describe_auto_scaling_groups')
+        paginate_args = {'Filters': filters} if filters else {}
+        
+        for page in paginator.paginate(**paginate_args):
+            asgs = page['AutoScalingGroups']
+            # Check if ASG name contains cluster name
+            matching_asgs = [asg for asg in asgs if self.cluster_name in asg['AutoScalingGroupName']]
+            logger.debug("Found %s ASGs, %s matching", len(asgs), len(matching_asgs))
+            
+            yield len(asgs), matching_asgs
+
+    @staticmethod
+    def _is_aws_asg_scaled_down(asg: Dict) -> bool:
+        """Check whether an ASG is already scaled down to 0.
+        
+        Args:
+            asg: ASG dictionary from describe_auto_scaling_groups
+            
+        Returns:
+            bool: True if min, max and desired capacity are all 0
+        """
+        return asg['DesiredCapacity'] == 0 and asg['MinSize'] == 0 and asg['MaxSize'] == 0
+
+    def _save_aws_asg_states(self, autoscaling, asgs: List[Dict]) -> List[Dict]:
+        """Save the current scaling state of ASGs to their OffHoursPrevious tags.
+        
+        Tags are written in batches before any ASG is scaled down, so an ASG
+        is only scaled down once its state is known to be saved.
+        
+        Args:
+            autoscaling: AWS autoscaling client
+            asgs: ASG dictionaries from describe_auto_scaling_groups
+            
+        Returns:
+            List[Dict]: ASGs whose state was saved
+        """
+        tags = []
+        for asg in asgs:
+            if self._is_aws_asg_scaled_down(asg):
+                continue
+            asg_name = asg['AutoScalingGroupName']
+            current_min = asg['MinSize']
+            current_max = asg['MaxSize']
+            current_desired = asg['DesiredCapacity']
+            
+            # Create tag value in AWS format
+            tag_value = f"MaxSize={current_max};DesiredCapacity={current_desired};MinSize={current_min}"
+            logger.info("  → Saving state for %s: min=%s, max=%s, desired=%s", asg_name, current_min, current_max, current_desired)
+            tags.append(self._aws_tag(asg_name, tag_value))
+        
+        saved = set(self._batch_aws_tags(autoscaling.create_or_update_tags, tags))
+        logger.debug("Saved current state to %s tag for %s ASGs", self.tag_name, len(saved))
+        return [asg for asg in asgs if asg['AutoScalingGroupName'] in saved]
+
     def _scale_down_aws_asg(self, autoscaling, asg: Dict, asg_name: str) -> bool:
-        """Scale down an AWS ASG to 0 and save current state.
+        """Scale down an AWS ASG to 0.
+        
+        The current state is saved beforehand by _save_aws_asg_states.
         
         Args:
             autoscaling: AWS autoscaling client
@@ -566,13 +1019,10 @@ class NodeGroupManager:
         current_desired = asg['DesiredCapacity']
         
         # Check if already at 0
-        if current_desired == 0 and current_min == 0 and current_max == 0:
-            logger.debug(f"ASG {asg_name} is already scaled down to 0")
+        if self._is_aws_asg_scaled_down(asg):
+            logger.debug("ASG %s is already scaled down to 0", asg_name)
             return False
         
-        # Create tag value in AWS format
-        tag_value = f"MaxSize={current_max};DesiredCapacity={current_desired};MinSize={current_min}"
-        
         # Add operation to the list
         operation = ScalingOperation(
             resource_name=asg_name,
@@ -585,30 +1035,15 @@ class NodeGroupManager:
         self._add_operation(operation)
         
         if not self.dry_run:
-            # Save current state to tag
-            logger.info(f"  → Saving state for {asg_name}: min={current_min}, max={current_max}, desired={current_desired}")
-            autoscaling.create_or_update_tags(
-                Tags=[
-                    {
-                        'ResourceId': asg_name,
-                        'ResourceType': 'auto-scaling-group',
-                        'Key': self.tag_name,
-                        'Value': tag_value,
-                        'PropagateAtLaunch': False
-                    }
-                ]
-            )
-            logger.debug(f"Saved current state to {self.tag_name} tag: {tag_value}")
-            
             # Scale down to 0
-            logger.info(f"  → Scaling down {asg_name} to 0 nodes")
+            logger.info("  → Scaling down %s to 0 nodes", asg_name)
             autoscaling.update_auto_scaling_group(
                 AutoScalingGroupName=asg_name,
                 MinSize=0,
                 MaxSize=0,
                 DesiredCapacity=0
             )
-            logger.info(f"  ✓ Successfully scaled down {asg_name} to 0")
+            logger.info("  ✓ Successfully scaled down %s to 0", asg_name)
             return True
         
         return True
@@ -617,7 +1052,9 @@ class NodeGroupManager:
         """Wait for a GKE operation to complete.
         
         This method polls the GKE API to check the status of an operation.
-        It will wait until the operation completes, fails, or times out.
+        The polling interval starts at ``poll_interval`` and backs off
+        exponentially (capped at MAX_POLL_INTERVAL) while the operation is
+        unfinished, to keep the number of get_operation calls low.
         
         Args:
             client: The GKE ClusterManagerClient
@@ -628,40 +1065,31 @@ class NodeGroupManager:
             
         Raises:
             TimeoutError: If the operation times out
+            InterruptedError: If stop() is called while waiting
             Exception: If the operation fails
         """
+        operation_request = container_v1.types.GetOperationRequest(
+            name=f"projects/{project_id}/locations/{location}/operations/{operation_name}"
+        )
+        interval = self.poll_interval
         start_time = time.time()
         while time.time() - start_time < timeout_seconds:
-            operation_request = container_v1.types.GetOperationRequest(
-                name=f"projects/{project_id}/locations/{location}/operations/{operation_name}"
-            )
-            operation_response = client.get_operation(request=operation_request)
+            # Status may come back as an enum or a raw integer depending on the
+            # client version; both hash and compare equal for the lookups below
+            status = client.get_operation(request=operation_request).status
             
-            # Handle status as both enum and integer for compatibility
-            status = operation_response.status
-            status_value = status.value if hasattr(status, 'value') else int(status)
-            
-            # Status enum values: STATUS_UNSPECIFIED=0, PENDING=1, RUNNING=2, DONE=3, ABORTING=4
-            if status_value == 3 or status == container_v1.Operation.Status.DONE:
-                logger.info("Operation completed successfully.")
-                return
-            elif status_value == 2 or status == container_v1.Operation.Status.RUNNING:
-                logger.info("Operation is still running...")
-                time.sleep(5)
-            elif status_value == 1 or status == container_v1.Operation.Status.PENDING:
-                logger.info("Operation is pending...")
-                time.sleep(5)
-            elif status_value == 4 or status == container_v1.Operation.Status.ABORTING:
-                logger.warning("Operation is aborting.")
+            if status in _GKE_TERMINAL_STATUSES:
+                logger.log(*_GKE_TERMINAL_STATUSES[status])
                 return
-            elif status_value == 0:
-                # STATUS_UNSPECIFIED - treat as pending and continue waiting
-                logger.debug("Operation status unspecified, continuing to wait...")
-                time.sleep(5)
+            elif status in _GKE_WAITING_STATUSES:
+                logger.log(*_GKE_WAITING_STATUSES[status])
             else:
                 # Log as warning instead of error for unknown but potentially valid statuses
-                logger.warning(f"Unknown operation status: {status_value} (operation: {operation_name})")
-                time.sleep(5)
+                logger.warning("Unknown operation status: %s (operation: %s)", status, operation_name)
+            
+            if self._stop_event.wait(interval):
+                raise InterruptedError(f"Stopped while waiting for operation {operation_name}")
+            interval = min(interval * 1.5, MAX_POLL_INTERVAL)
 
         raise TimeoutError(f"Operation {operation_name} timed out after {timeout_seconds} seconds.")
 
@@ -677,47 +1105,36 @@ class NodeGroupManager:
             ValueError: If tag parsing fails
         """
         try:
-            logger.debug(f"Starting GCP node group management for cluster: {self.cluster_name}")
+            logger.debug("Starting GCP node group management for cluster: %s", self.cluster_name)
             
-            client = container_v1.ClusterManagerClient()
-            project_id = self.account
-            parent = f"projects/{project_id}/locations/-"
+            client = self._gke_client
+            project_id = _resolve_project_id(self.account)
             
             try:
-                logger.info("Searching for GKE clusters...")
-                clusters = client.list_clusters(parent=parent)
+                cluster = self._find_gke_cluster(client, project_id)
                 
-                cluster_found = False
+                cluster_found = cluster is not None
                 node_pool_count = 0
                 matching_node_pool_count = 0
                 processed_count = 0
                 
-                for cluster in clusters.clusters:
-                    if cluster.name == self.cluster_name:
-                        cluster_found = True
-                        logger.debug(f"Found matching cluster: {cluster.name} in {cluster.location}")
-                        node_pool_count = len(cluster.node_pools)
-                        matching_node_pool_count = node_pool_count
-                        
-                        # Process node pools in parallel
-                        if cluster.node_pools:
-                            logger.info(f"Processing {node_pool_count} node pools in parallel...")
-                            with ThreadPoolExecutor(max_workers=5) as executor:
-                                futures = {executor.submit(self._process_gcp_node_pool, client, project_id, cluster, node_pool): node_pool 
-                                          for node_pool in cluster.node_pools}
-                                
-                                for future in as_completed(futures):
-                                    node_pool = futures[future]
-                                    try:
-                                        was_processed = future.result()
-                                        if was_processed:
-                                            processed_count += 1
-                                    except google_exceptions.GoogleAPIError as e:
-                                        logger.error(f"Error processing node pool {node_pool.name}: {str(e)}")
-                                    except Exception as e:
-                                        logger.error(f"Unexpected error processing node pool {node_pool.name}: {str(e)}")
-                        
-                        break
+                if cluster_found:
+                    logger.debug("Found matching cluster: %s in %s", cluster.name, cluster.location)
+                    node_pool_count = len(cluster.node_pools)
+                    # Skip pools with nothing to do using the listed configuration
+                    if self.scale_down:
+                        node_pools = [np for np in cluster.node_pools if any(self._gcp_node_pool_sizes(np))]
+                    else:
+                        node_pools = [np for np in cluster.node_pools if self.tag_name in np.config.labels]
+                    matching_node_pool_count = len(node_pools)
+                    
+                    # Process node pools in parallel
+                    if node_pools:
+                        logger.info("Processing %s node pools in parallel...", matching_node_pool_count)
+                        processed_count = len(self._run_parallel(
+                            partial(self._process_gcp_node_pool, client, project_id, cluster),
+                            node_pools, max_workers=self._max_workers(matching_node_pool_count)
+                        ))
                 
                 # Summary
                 logger.info("")
@@ -728,22 +1145,22 @@ class NodeGroupManager:
                     logger.info("SUMMARY")
                 logger.info("=" * 60)
                 if cluster_found:
-                    logger.info(f"Cluster found: {self.cluster_name}")
-                    logger.info(f"Total node pools in cluster: {node_pool_count}")
-                    logger.info(f"Node pools processed: {matching_node_pool_count}")
+                    logger.info("Cluster found: %s", self.cluster_name)
+                    logger.info("Total node pools in cluster: %s", node_pool_count)
+                    logger.info("Node pools processed: %s", matching_node_pool_count)
                     
                     if self.dry_run:
-                        # In dry run, count operations that would be performed (filter by GCP provider)
-                        gcp_operations = [op for op in self.operations if op.provider == CloudProvider.GCP]
+                        # In dry run, count operations that would be performed
+                        gcp_operations = self._ops_by_provider[CloudProvider.GCP]
                         would_update_count = len(gcp_operations)
                         if would_update_count > 0:
-                            logger.info(f"Node pools that would be updated: {would_update_count}")
+                            logger.info("Node pools that would be updated: %s", would_update_count)
                             for op in gcp_operations:
                                 if self.scale_down:
-                                    logger.info(f"  - {op.resource_name}: {op.current_size} → 0 nodes (saving state: min={op.min_size}, max={op.max_size}, desired={op.current_size})")
+                                    logger.info("  - %s: %s → 0 nodes (saving state: min=%s, max=%s, desired=%s)", op.resource_name, op.current_size, op.min_size, op.max_size, op.current_size)
                                 else:
-                                    logger.info(f"  - {op.resource_name}: {op.current_size} → {op.target_size} nodes (min={op.min_size}, max={op.max_size})")
-                        elif matching_node_pool_count > 0:
+                                    logger.info("  - %s: %s → %s nodes (min=%s, max=%s)", op.resource_name, op.current_size, op.target_size, op.min_size, op.max_size)
+                        elif node_pool_count > 0:
                             if self.scale_down:
                                 logger.info("No node pools would be updated (already at 0 or no matching node pools)")
                             else:
@@ -751,26 +1168,82 @@ class NodeGroupManager:
                     else:
                         # Normal execution
                         if processed_count > 0:
-                            logger.info(f"Node pools successfully updated: {processed_count}")
-                        elif matching_node_pool_count > 0:
+                            logger.info("Node pools successfully updated: %s", processed_count)
+                        elif node_pool_count > 0:
                             if self.scale_down:
                                 logger.info("No node pools required updates (already at 0 or no matching node pools)")
                             else:
                                 logger.info("No node pools required updates (no offhoursprevious labels found)")
                 else:
-                    logger.warning(f"Cluster '{self.cluster_name}' not found in project '{project_id}'")
+                    logger.warning("Cluster '%s' not found in project '%s'", self.cluster_name, project_id)
                 logger.info("=" * 60)
                                 
             except google_exceptions.GoogleAPIError as e:
-                logger.error(f"Error listing clusters: {str(e)}")
+                logger.error("Error finding cluster: %s", e)
                 raise
                 
         except Exception as e:
-            logger.error(f"GCP API error: {str(e)}")
+            logger.error("GCP API error: %s", e)
             raise
 
-    def _process_gcp_node_pool(self, client: container_v1.ClusterManagerClient, project_id: str, cluster: Any, node_pool: Any) -> bool:
-        """Process a single GCP node pool.
+    def _find_gke_cluster(self, client: container_v1.ClusterManagerClient, project_id: str) -> Any:
+        """Find the GKE cluster to manage.
+        
+        When the cluster location is known, the cluster is fetched directly
+        with get_cluster. Otherwise every cluster in the project is listed and
+        matched by name.
+        
+        Args:
+            client: The GKE ClusterManagerClient
+            project_id: The GCP project ID
+            
+        Returns:
+            The GKE cluster, or None if it was not found
+        """
+        if self.location:
+            logger.info("Fetching GKE cluster...")
+            try:
+                return client.get_cluster(
+                    name=f"projects/{project_id}/locations/{self.location}/clusters/{self.cluster_name}"
+                )
+            except google_exceptions.NotFound:
+                return None
+        
+        logger.info("Searching for GKE clusters...")
+        clusters = client.list_clusters(parent=f"projects/{project_id}/locations/-")
+        for cluster in clusters.clusters:
+            if cluster.name == self.cluster_name:
+                return cluster
+        return None
+
+    def _process_gcp_node_pool(self, client: container_v1.ClusterManagerClient, project_id: str, cluster: Any, node_pool: Any) -> Tuple[str, bool]:
+        """Process a single GCP node pool, logging any error with the node pool name.
+        
+        Args:
+            client: The GKE ClusterManagerClient
+            project_id: The GCP project ID
+            cluster: The GKE cluster
+            node_pool: The node pool to process
+            
+        Returns:
+            Tuple of (node pool name, True if the node pool was processed/updated)
+        """
+        try:
+            return node_pool.name, self._apply_gcp_node_pool(client, project_id, cluster, node_pool)
+        except InterruptedError as e:
+            logger.warning("Node pool %s not processed: %s", node_pool.name, e)
+        except google_exceptions.GoogleAPIError as e:
+            logger.error("Error processing node pool %s: %s", node_pool.name, e)
+        except Exception as e:
+            logger.error("Unexpected error processing node pool %s: %s", node_pool.name, e)
+        return node_pool.name, False
+
+    def _apply_gcp_node_pool(self, client: container_v1.ClusterManagerClient, project_id: str, cluster: Any, node_pool: Any) -> bool:
+        """Apply scaling to a single GCP node pool.
+        
+        The node pool is taken from the cluster listing, which already carries
+        the full node pool configuration (labels, autoscaling, sizes), so no
+        extra get_node_pool call is needed here.
         
         Args:
             client: The GKE ClusterManagerClient
@@ -781,20 +1254,25 @@ class NodeGroupManager:
         Returns:
             bool: True if the node pool was processed/updated, False otherwise
         """
-        node_pool_name = f"projects/{project_id}/locations/{cluster.location}/clusters/{cluster.name}/nodePools/{node_pool.name}"
-        node_pool_details = client.get_node_pool(name=node_pool_name)
+        self._raise_if_stopped(node_pool.name)
+        ctx = _PoolCtx(
+            name=f"projects/{project_id}/locations/{cluster.location}/clusters/{cluster.name}/nodePools/{node_pool.name}",
+            project_id=project_id,
+            location=cluster.location,
+            pool=node_pool
+        )
         
         if self.scale_down:
             # Scale down mode: save current state and scale to 0
-            return self._scale_down_gcp_node_pool(client, node_pool_name, project_id, cluster, node_pool, node_pool_details)
+            return self._scale_down_gcp_node_pool(client, ctx)
         else:
             # Scale up mode: restore from offhoursprevious label
-            current_labels = dict(node_pool_details.config.labels)
+            labels = node_pool.config.labels
             
             # Check for offhoursprevious in labels
-            if self.tag_name in node_pool_details.config.labels:
-                off_hours_previous = node_pool_details.config.labels[self.tag_name]
-                logger.debug(f"Found {self.tag_name} label for node pool: {node_pool.name}")
+            if self.tag_name in labels:
+                off_hours_previous = labels[self.tag_name]
+                logger.debug("Found %s label for node pool: %s", self.tag_name, node_pool.name)
                 
                 try:
                     max_size, desired_capacity, min_size = self._parse_scaling_values(off_hours_previous)
@@ -812,21 +1290,36 @@ class NodeGroupManager:
                     
                     # Execute operation if not in dry run mode
                     if not self.dry_run:
-                        logger.info(f"  → Updating {node_pool.name}: scaling from {node_pool.initial_node_count} to {desired_capacity} nodes (min={min_size}, max={max_size})")
-                        self._execute_gcp_scaling(client, node_pool_name, project_id, cluster.location, 
-                                               desired_capacity, min_size, max_size, current_labels, node_pool=node_pool)
-                        logger.info(f"  ✓ Successfully updated {node_pool.name}")
+                        logger.info("  → Updating %s: scaling from %s to %s nodes (min=%s, max=%s)", node_pool.name, node_pool.initial_node_count, desired_capacity, min_size, max_size)
+                        # NodeLabels replaces the whole map, so copy it only now that it changes
+                        self._execute_gcp_scaling(client, ctx, desired_capacity, min_size, max_size, dict(labels))
+                        logger.info("  ✓ Successfully updated %s", node_pool.name)
                         return True
                     else:
                         return True
                         
                 except ValueError as e:
-                    logger.error(f"Error parsing scaling values for node pool {node_pool.name}: {str(e)}")
+                    logger.error("Error parsing scaling values for node pool %s: %s", node_pool.name, e)
                 except google_exceptions.GoogleAPIError as e:
-                    logger.error(f"Error updating node pool {node_pool.name}: {str(e)}")
+                    logger.error("Error updating node pool %s: %s", node_pool.name, e)
             
             return False
 
+    def _get_igm_client(self) -> compute_v1.InstanceGroupManagersClient:
+        """Get the shared Compute Engine instance group managers client.
+        
+        The client is created on first use, since dry runs and pools without
+        instance groups never need it.
+        
+        Returns:
+            compute_v1.InstanceGroupManagersClient: The shared client
+        """
+        with self._igm_client_lock:
+            if self._igm_client is None:
+                logger.debug("Creating Compute Engine instance group managers client")
+                self._igm_client = compute_v1.InstanceGroupManagersClient()
+            return self._igm_client
+
     def _resize_single_instance_group(self, project_id: str, instance_group_url: str, target_size: int) -> None:
         """Resize a single GCP instance group.
         
@@ -836,40 +1329,40 @@ class NodeGroupManager:
             target_size: Target size for the instance group
         """
         # Parse the instance group URL to extract zone and name
-        # Format: https://www.googleapis.com/compute/v1/projects/PROJECT/zones/ZONE/instanceGroupManagers/NAME
-        url_parts = instance_group_url.split('/')
-        if len(url_parts) < 9:
-            logger.warning(f"Invalid instance group URL format: {instance_group_url}")
+        match = _IGM_URL_RE.search(instance_group_url)
+        if not match:
+            logger.warning("Invalid instance group URL format: %s", instance_group_url)
             return
         
-        zone = url_parts[8]  # Zone is at index 8
-        igm_name = url_parts[-1]  # Name is the last part
+        zone, igm_name = match.group('zone'), match.group('name')
         
-        logger.debug(f"Resizing instance group {igm_name} in zone {zone} to {target_size}")
+        logger.debug("Resizing instance group %s in zone %s to %s", igm_name, zone, target_size)
         
         if not self.dry_run:
-            with compute_v1.InstanceGroupManagersClient() as igm_client:
-                resize_request = compute_v1.ResizeInstanceGroupManagerRequest(
-                    instance_group_manager=igm_name,
-                    project=project_id,
-                    size=target_size,
-                    zone=zone
-                )
-                igm_resize_operation = igm_client.resize(request=resize_request)
-                logger.info(f"  → Resized instance group {igm_name} to {target_size}. Operation: {igm_resize_operation.name}")
+            resize_request = compute_v1.ResizeInstanceGroupManagerRequest(
+                instance_group_manager=igm_name,
+                project=project_id,
+                size=target_size,
+                zone=zone
+            )
+            igm_resize_operation = self._get_igm_client().resize(request=resize_request)
+            logger.info("  → Resized instance group %s to %s. Operation: %s", igm_name, target_size, igm_resize_operation.name)
         else:
-            logger.info(f"  [DRY RUN] Would resize instance group {igm_name} to {target_size}")
+            logger.info("  [DRY RUN] Would resize instance group %s to %s", igm_name, target_size)
 
     def _resize_instance_groups(self, project_id: str, node_pool: Any, target_size: int) -> None:
         """Resize GCP instance groups associated with a node pool in parallel.
         
+        The resizes run on the manager's shared, bounded executor, so node
+        pools processed concurrently do not each start their own threads.
+        
         Args:
             project_id: The GCP project ID
             node_pool: The node pool object containing instance_group_urls
             target_size: Target size for the instance groups (0 for scale down)
         """
         if not hasattr(node_pool, 'instance_group_urls') or not node_pool.instance_group_urls:
-            logger.debug(f"No instance group URLs found for node pool {node_pool.name}")
+            logger.debug("No instance group URLs found for node pool %s", node_pool.name)
             return
         
         instance_group_urls = node_pool.instance_group_urls
@@ -878,58 +1371,59 @@ class NodeGroupManager:
             self._resize_single_instance_group(project_id, instance_group_urls[0], target_size)
         else:
             # Multiple instance groups, process in parallel
-            logger.debug(f"Resizing {len(instance_group_urls)} instance groups in parallel...")
+            logger.debug("Resizing %s instance groups in parallel...", len(instance_group_urls))
             try:
-                with ThreadPoolExecutor(max_workers=len(instance_group_urls)) as executor:
-                    futures = {executor.submit(self._resize_single_instance_group, project_id, url, target_size): url 
-                              for url in instance_group_urls}
-                    
-                    for future in as_completed(futures):
-                        url = futures[future]
-                        try:
-                            future.result()
-                        except google_exceptions.GoogleAPIError as e:
-                            logger.error(f"Error resizing instance group {url}: {str(e)}")
-                        except Exception as e:
-                            logger.error(f"Unexpected error resizing instance group {url}: {str(e)}")
+                futures = {self._igm_executor.submit(self._resize_single_instance_group, project_id, url, target_size): url 
+                          for url in instance_group_urls}
+                
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        future.result()
+                    except google_exceptions.GoogleAPIError as e:
+                        logger.error("Error resizing instance group %s: %s", url, e)
+                    except Exception as e:
+                        logger.error("Unexpected error resizing instance group %s: %s", url, e)
             except Exception as e:
-                logger.error(f"Error resizing instance groups: {str(e)}")
+                logger.error("Error resizing instance groups: %s", e)
                 raise
 
-    def _scale_down_gcp_node_pool(self, client: container_v1.ClusterManagerClient, node_pool_name: str, 
-                                  project_id: str, cluster: Any, node_pool: Any, node_pool_details: Any) -> bool:
-        """Scale down a GCP node pool to 0 and save current state.
+    @staticmethod
+    def _gcp_node_pool_sizes(node_pool: Any) -> Tuple[int, int, int]:
+        """Get the current scaling values of a GCP node pool.
+        
+        When autoscaling is disabled, initial_node_count is used for both
+        min and max.
         
         Args:
-            client: The GKE ClusterManagerClient
-            node_pool_name: Full name of the node pool
-            project_id: The GCP project ID
-            cluster: The GKE cluster
             node_pool: The node pool object
-            node_pool_details: The detailed node pool information
             
         Returns:
-            bool: True if the node pool was processed, False otherwise
+            Tuple[int, int, int]: (min, max, desired) node counts
         """
-        # Get current scaling values (handle case where autoscaling is disabled)
         if node_pool.autoscaling and node_pool.autoscaling.enabled:
-            current_min = node_pool.autoscaling.min_node_count
-            current_max = node_pool.autoscaling.max_node_count
-        else:
-            # Autoscaling is disabled, use initial_node_count for both min and max
-            current_min = node_pool.initial_node_count
-            current_max = node_pool.initial_node_count
+            return (node_pool.autoscaling.min_node_count, node_pool.autoscaling.max_node_count,
+                    node_pool.initial_node_count)
+        return node_pool.initial_node_count, node_pool.initial_node_count, node_pool.initial_node_count
+
+    def _scale_down_gcp_node_pool(self, client: container_v1.ClusterManagerClient, ctx: _PoolCtx) -> bool:
+        """Scale down a GCP node pool to 0 and save current state.
         
-        current_desired = node_pool.initial_node_count
+        Args:
+            client: The GKE ClusterManagerClient
+            ctx: The node pool to scale down
+            
+        Returns:
+            bool: True if the node pool was processed, False otherwise
+        """
+        node_pool = ctx.pool
+        current_min, current_max, current_desired = self._gcp_node_pool_sizes(node_pool)
         
         # Check if already at 0
         if current_desired == 0 and current_min == 0 and current_max == 0:
-            logger.debug(f"Node pool {node_pool.name} is already scaled down to 0")
+            logger.debug("Node pool %s is already scaled down to 0", node_pool.name)
             return False
         
-        # Get current labels for saving state
-        current_labels = dict(node_pool_details.config.labels)
-        
         # Create label value in GCP format
         label_value = (
             f"maxsize{current_max}-"
@@ -949,68 +1443,81 @@ class NodeGroupManager:
         self._add_operation(operation)
         
         if not self.dry_run:
-            # Save current state to label
-            logger.info(f"  → Saving state for {node_pool.name}: min={current_min}, max={current_max}, desired={current_desired}")
-            current_labels[self.tag_name] = label_value
-            update_request = container_v1.UpdateNodePoolRequest(
-                name=node_pool_name,
-                labels=container_v1.NodeLabels(labels=current_labels)
-            )
-            operation = client.update_node_pool(request=update_request)
-            logger.debug(f"Saved current state to {self.tag_name} label: {label_value}")
-            self._wait_for_operation(client, project_id, cluster.location, operation.name.split('/')[-1])
+            # Save current state to label, unless a previous partial run already did
+            labels = node_pool.config.labels
+            if labels.get(self.tag_name) == label_value:
+                logger.debug("%s label already up to date for %s, skipping state save", self.tag_name, node_pool.name)
+            else:
+                logger.info("  → Saving state for %s: min=%s, max=%s, desired=%s", node_pool.name, current_min, current_max, current_desired)
+                # NodeLabels replaces the whole map, so copy it only when it changes
+                current_labels = dict(labels)
+                current_labels[self.tag_name] = label_value
+                update_request = container_v1.UpdateNodePoolRequest(
+                    name=ctx.name,
+                    labels=container_v1.NodeLabels(labels=current_labels)
+                )
+                operation = client.update_node_pool(request=update_request, retry=_GKE_MUTATION_RETRY)
+                logger.debug("Saved current state to %s label: %s", self.tag_name, label_value)
+                self._wait_for_operation(client, ctx.project_id, ctx.location, operation.name.split('/')[-1])
             
             # Scale down to 0
-            logger.info(f"  → Scaling down {node_pool.name} to 0 nodes")
-            self._execute_gcp_scaling(client, node_pool_name, project_id, cluster.location, 
-                                    0, 0, 0, current_labels, remove_label=False)
+            logger.info("  → Scaling down %s to 0 nodes", node_pool.name)
+            self._execute_gcp_scaling(client, ctx, 0, 0, 0, remove_label=False)
             
             # Resize instance groups to 0
-            logger.info(f"  → Resizing instance groups for {node_pool.name} to 0")
-            self._resize_instance_groups(project_id, node_pool, 0)
+            logger.info("  → Resizing instance groups for %s to 0", node_pool.name)
+            self._raise_if_stopped(node_pool.name)
+            self._resize_instance_groups(ctx.project_id, node_pool, 0)
             
-            logger.info(f"  ✓ Successfully scaled down {node_pool.name} to 0")
+            logger.info("  ✓ Successfully scaled down %s to 0", node_pool.name)
             return True
         
         return True
 
-    def _execute_gcp_scaling(self, client: container_v1.ClusterManagerClient, node_pool_name: str, 
-                           project_id: str, location: str, desired_capacity: int, 
-                           min_size: int, max_size: int, current_labels: Dict[str, str], 
-                           remove_label: bool = True, node_pool: Any = None) -> None:
+    def _execute_gcp_scaling(self, client: container_v1.ClusterManagerClient, ctx: _PoolCtx,
+                           desired_capacity: int, min_size: int, max_size: int,
+                           current_labels: Dict[str, str] = None, remove_label: bool = True) -> None:
         """Execute GCP node pool scaling operations.
         
+        GKE has no single request setting size, autoscaling and labels
+        together, so each change is its own operation; changes that would be
+        no-ops are skipped to avoid an extra operation round-trip. The
+        autoscaling change is issued while the resize is still running when
+        GKE accepts it, and only after the resize otherwise.
+        
         Args:
             client: The GKE ClusterManagerClient
-            node_pool_name: Full name of the node pool
-            project_id: The GCP project ID
-            location: The cluster location
+            ctx: The node pool to scale
             desired_capacity: Target number of nodes
             min_size: Minimum number of nodes
             max_size: Maximum number of nodes
-            current_labels: Current node pool labels
+            current_labels: Current node pool labels (only needed to remove the label)
             remove_label: If True, remove the offhoursprevious label after scaling (default: True)
-            node_pool: The node pool object (optional, needed for instance group scaling)
         """
+        node_pool_name, project_id, location, node_pool = ctx.name, ctx.project_id, ctx.location, ctx.pool
+        self._raise_if_stopped(node_pool.name)
         # Set node pool size
         size_request = container_v1.SetNodePoolSizeRequest(
             name=node_pool_name,
             node_count=desired_capacity
         )
-        operation = client.set_node_pool_size(request=size_request)
-        logger.debug(f"Setting node pool size to {desired_capacity}")
-        self._wait_for_operation(client, project_id, location, operation.name.split('/')[-1])
+        size_operation = client.set_node_pool_size(request=size_request, retry=_GKE_MUTATION_RETRY)
+        logger.debug("Setting node pool size to %s", desired_capacity)
         
         # Enable autoscaling (or disable if min=max=0)
         if min_size == 0 and max_size == 0:
-            # Disable autoscaling when scaling to 0
-            autoscaling_request = container_v1.SetNodePoolAutoscalingRequest(
-                name=node_pool_name,
-                autoscaling=container_v1.NodePoolAutoscaling(
-                    enabled=False
+            if not (node_pool.autoscaling and node_pool.autoscaling.enabled):
+                autoscaling_request = None
+                logger.debug("Autoscaling already disabled, skipping autoscaling update")
+            else:
+                # Disable autoscaling when scaling to 0
+                autoscaling_request = container_v1.SetNodePoolAutoscalingRequest(
+                    name=node_pool_name,
+                    autoscaling=container_v1.NodePoolAutoscaling(
+                        enabled=False
+                    )
                 )
-            )
-            logger.debug("Disabling autoscaling (scaled to 0)")
+                logger.debug("Disabling autoscaling (scaled to 0)")
         else:
             # Enable autoscaling with specified limits
             autoscaling_request = container_v1.SetNodePoolAutoscalingRequest(
@@ -1022,33 +1529,97 @@ class NodeGroupManager:
                 )
             )
             logger.debug("Enabling autoscaling")
-        operation = client.set_node_pool_autoscaling(request=autoscaling_request)
-        self._wait_for_operation(client, project_id, location, operation.name.split('/')[-1])
+        if autoscaling_request is None:
+            self._wait_for_operation(client, project_id, location, size_operation.name.split('/')[-1])
+        else:
+            # Issue the autoscaling change without waiting for the resize first;
+            # if GKE rejects it because the resize is still running, fall back
+            # to waiting and retrying sequentially
+            try:
+                operation = client.set_node_pool_autoscaling(request=autoscaling_request)
+                self._wait_for_operation(client, project_id, location, size_operation.name.split('/')[-1])
+            except google_exceptions.FailedPrecondition:
+                logger.debug("Node pool busy, waiting for the resize before updating autoscaling")
+                self._wait_for_operation(client, project_id, location, size_operation.name.split('/')[-1])
+                operation = client.set_node_pool_autoscaling(request=autoscaling_request, retry=_GKE_MUTATION_RETRY)
+            self._wait_for_operation(client, project_id, location, operation.name.split('/')[-1])
         
-        # Resize instance groups if node_pool is provided and we're scaling up (not to 0)
-        if node_pool and desired_capacity > 0:
-            logger.info(f"  → Resizing instance groups to {desired_capacity}")
-            # Get updated node pool to ensure we have the latest instance_group_urls
-            updated_node_pool = client.get_node_pool(name=node_pool_name)
-            self._resize_instance_groups(project_id, updated_node_pool, desired_capacity)
+        # Resize instance groups if we're scaling up (not to 0)
+        if desired_capacity > 0:
+            logger.info("  → Resizing instance groups to %s", desired_capacity)
+            # Instance groups persist across resizes, so the listed node pool's
+            # URLs are reused; only fetch the node pool if it had none
+            if not node_pool.instance_group_urls:
+                node_pool = client.get_node_pool(name=node_pool_name)
+            self._raise_if_stopped(node_pool.name)
+            self._resize_instance_groups(project_id, node_pool, desired_capacity)
         
         # Remove the offhoursprevious label if requested (only in scale-up mode)
         if remove_label:
+            self._raise_if_stopped(node_pool.name)
             current_labels.pop(self.tag_name, None)
             update_request = container_v1.UpdateNodePoolRequest(
                 name=node_pool_name,
                 labels=container_v1.NodeLabels(labels=current_labels)
             )
-            operation = client.update_node_pool(request=update_request)
-            logger.debug(f"Removing {self.tag_name} label")
+            operation = client.update_node_pool(request=update_request, retry=_GKE_MUTATION_RETRY)
+            logger.debug("Removing %s label", self.tag_name)
             self._wait_for_operation(client, project_id, location, operation.name.split('/')[-1])
 
+def _configure_logging(verbose: int, log_path: str = None) -> None:
+    """Configure log level and handlers.
+    
+    Handlers are attached on the first call only, so importing the module
+    has no side effects and repeated calls do not duplicate log lines. Logs
+    go to the console; a rotating log file is only opened when requested.
+    
+    Args:
+        verbose: Verbosity count from the command line
+        log_path: Path of the log file to write to, or None for console only
+    """
+    if verbose == 1:
+        logger.setLevel(logging.INFO)
+    elif verbose >= 2:
+        logger.setLevel(logging.DEBUG)
+    
+    if logger.handlers:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    
+    # Our handlers write every record; don't hand them to root handlers as well
+    logger.propagate = False
+    
+    # Set up console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+    logger.addHandler(console_handler)
+    
+    if log_path:
+        # Create log directory if it doesn't exist
+        os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+        
+        # Set up file handler with rotation
+        file_handler = RotatingFileHandler(
+            log_path,
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=5
+        )
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
+    
+    # Log startup information (detailed info goes to file, minimal to console)
+    logger.debug("Starting Node Group Manager")
+    logger.debug("Log file: %s", log_path)
+    logger.debug("Python version: %s", sys.version)
+    logger.debug("Working directory: %s", os.getcwd())
+
 def main():
     """Main entry point for the script.
     
     This function:
     1. Parses command line arguments
-    2. Configures logging
+    2. Configures logging (see _configure_logging)
     3. Creates and runs the NodeGroupManager
     4. Handles errors and exits appropriately
     """
@@ -1072,7 +1643,7 @@ def main():
     )
     parser.add_argument(
         '--account',
-        help='AWS account ID or GCP project ID (REQUIRED for GCP)'
+        help='AWS account ID or GCP project ID (GCP: defaults to GOOGLE_CLOUD_PROJECT/PROJECT_ID or the default credentials project)'
     )
     
     # Optional arguments
@@ -1080,6 +1651,10 @@ def main():
         '--region',
         help='AWS region (REQUIRED for AWS)'
     )
+    parser.add_argument(
+        '--location',
+        help='GKE cluster location, region or zone (optional for GCP, avoids listing all clusters)'
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -1090,6 +1665,32 @@ def main():
         action='store_true',
         help='Scale down to 0 and save current state (opposite of scale up)'
     )
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f'Initial interval in seconds between GKE operation status checks, backs off up to {MAX_POLL_INTERVAL}s (default: {DEFAULT_POLL_INTERVAL})'
+    )
+    parser.add_argument(
+        '--max-concurrency', '--max-workers',
+        dest='max_concurrency',
+        type=int,
+        default=None,
+        help=f'Maximum number of node groups processed concurrently (default: auto, up to {DEFAULT_AWS_MAX_WORKERS} ASGs or {DEFAULT_GCP_MAX_WORKERS} GKE node pools)'
+    )
+    parser.add_argument(
+        '--legacy-scan',
+        action='store_true',
+        help='AWS: scan every ASG in scale-up mode instead of filtering on the OffHoursPrevious tag'
+    )
+    parser.add_argument(
+        '--log-file',
+        nargs='?',
+        const=log_file,
+        default=None,
+        metavar='PATH',
+        help=f'Also write logs to a rotating log file (default path: {log_file})'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='count',
@@ -1100,10 +1701,7 @@ def main():
     args = parser.parse_args()
 
     # Configure logging based on verbosity
-    if args.verbose == 1:
-        logger.setLevel(logging.INFO)
-    elif args.verbose >= 2:
-        logger.setLevel(logging.DEBUG)
+    _configure_logging(args.verbose, args.log_file)
     
     try:
         manager = NodeGroupManager(
@@ -1112,9 +1710,31 @@ def main():
             account=args.account,
             region=args.region,
             dry_run=args.dry_run,
-            scale_down=args.scale_down
+            scale_down=args.scale_down,
+            poll_interval=args.poll_interval,
+            max_concurrency=args.max_concurrency,
+            legacy_scan=args.legacy_scan,
+            location=args.location
         )
-        manager.manage_node_groups()
+        
+        # On Ctrl+C / SIGTERM, stop waiting on cloud operations and starting
+        # new changes instead of blocking until every node group is done
+        def handle_stop_signal(signum, frame):
+            logger.warning("Received signal %s, stopping...", signum)
+            manager.stop()
+            if signum == signal.SIGINT:
+                # A second Ctrl+C aborts right away
+                logger.warning("Press Ctrl+C again to abort immediately")
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+        
+        for stop_signal in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(stop_signal, handle_stop_signal)
+        
+        with manager:
+            manager.manage_node_groups()
+        if manager.stopped:
+            logger.error("Script execution was interrupted")
+            sys.exit(1)
     except ValidationError as e:
         logger.error(f"Validation error: {str(e)}")
         sys.exit(1)